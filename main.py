@@ -95,7 +95,8 @@ from matrix.server import (MatrixServer, create_default_server,
                            matrix_config_server_write_cb, matrix_timer_cb,
                            send_cb, matrix_load_users_cb)
 from matrix.utf import utf8_decode
-from matrix.utils import server_buffer_prnt, server_buffer_set_title
+from matrix.utils import (server_buffer_prnt, server_buffer_set_title,
+                          server_from_buffer)
 
 from matrix.uploads import UploadsBuffer, upload_cb
 
@@ -568,40 +569,35 @@ def buffer_switch_cb(_, _signal, buffer_ptr):
 
     Read receipts are send out from here as well.
     """
-    for server in SERVERS.values():
-        if buffer_ptr == server.server_buffer:
-            return W.WEECHAT_RC_OK
-
-        if buffer_ptr not in server.buffers.values():
-            continue
-
-        room_buffer = server.find_room_from_ptr(buffer_ptr)
-        if not room_buffer:
-            continue
+    server = server_from_buffer(buffer_ptr)
+    if not server:
+        return W.WEECHAT_RC_OK
 
-        last_event_id = room_buffer.last_event_id
+    room_buffer = server.find_room_from_ptr(buffer_ptr)
+    if not room_buffer:
+        return W.WEECHAT_RC_OK
 
-        if room_buffer.should_send_read_marker:
-            # A buffer may not have any events, in that case no event id is
-            # here returned
-            if last_event_id:
-                server.room_send_read_marker(
-                    room_buffer.room.room_id, last_event_id)
-                room_buffer.last_read_event = last_event_id
+    last_event_id = room_buffer.last_event_id
 
-        if not room_buffer.members_fetched:
-            room_id = room_buffer.room.room_id
-            server.get_joined_members(room_id)
+    if room_buffer.should_send_read_marker:
+        # A buffer may not have any events, in that case no event id is
+        # here returned
+        if last_event_id:
+            server.room_send_read_marker(
+                room_buffer.room.room_id, last_event_id)
+            room_buffer.last_read_event = last_event_id
 
-        # The buffer is empty and we are seeing it for the first time.
-        # Let us fetch some messages from the room history so it doesn't feel so
-        # empty.
-        if room_buffer.first_view and room_buffer.weechat_buffer.num_lines < 10:
-            # TODO we may want to fetch 10 - num_lines messages here for
-            # consistency reasons.
-            server.room_get_messages(room_buffer.room.room_id)
+    if not room_buffer.members_fetched:
+        room_id = room_buffer.room.room_id
+        server.get_joined_members(room_id)
 
-        break
+    # The buffer is empty and we are seeing it for the first time.
+    # Let us fetch some messages from the room history so it doesn't feel so
+    # empty.
+    if room_buffer.first_view and room_buffer.weechat_buffer.num_lines < 10:
+        # TODO we may want to fetch 10 - num_lines messages here for
+        # consistency reasons.
+        server.room_get_messages(room_buffer.room.room_id)
 
     return W.WEECHAT_RC_OK
 
@@ -613,14 +609,13 @@ def typing_notification_cb(data, signal, buffer_ptr):
     It checks if we are on a buffer we own, and if we are sends out a typing
     notification if the room is configured to send them out.
     """
-    for server in SERVERS.values():
-        room_buffer = server.find_room_from_ptr(buffer_ptr)
-        if room_buffer:
-            server.room_send_typing_notice(room_buffer)
-            return W.WEECHAT_RC_OK
+    server = server_from_buffer(buffer_ptr)
+    if not server:
+        return W.WEECHAT_RC_OK
 
-        if buffer_ptr == server.server_buffer:
-            return W.WEECHAT_RC_OK
+    room_buffer = server.find_room_from_ptr(buffer_ptr)
+    if room_buffer:
+        server.room_send_typing_notice(room_buffer)
 
     return W.WEECHAT_RC_OK
 
@@ -2,6 +2,9 @@ import datetime
 import random
 import string
 
+WEECHAT_RC_OK = 0
+WEECHAT_RC_ERROR = -1
+
 WEECHAT_BASE_COLORS = {
     "black":        "0",
     "red":          "1",
@@ -204,6 +207,18 @@ def config_new_option(*_, **__):
     pass
 
 
+def config_integer(*_, **__):
+    return 0
+
+
+def config_string(*_, **__):
+    return ""
+
+
+def config_option_free(*_, **__):
+    return
+
+
 def mkdir_home(*_, **__):
     return True
 
@@ -225,6 +240,22 @@ def buffer_set(*_, **__):
     return
 
 
+def buffer_close(*_, **__):
+    return
+
+
+def buffer_merge(*_, **__):
+    return
+
+
+def buffer_unmerge(*_, **__):
+    return
+
+
+def buffer_search_main():
+    return 1
+
+
 def buffer_get_string(_ptr, property):
     if property == "localvar_type":
         return "channel"
@@ -255,5 +286,9 @@ def nicklist_search_nick(*args, **kwargs):
     return buffer_new(args, kwargs)
 
 
+def string_eval_expression(expression, *_, **__):
+    return expression
+
+
 def string_remove_color(message, _):
     return message
@@ -17,20 +17,22 @@
 from __future__ import unicode_literals
 
 from . import globals as G
-from .globals import SERVERS, W
+from .globals import W
 from .utf import utf8_decode
+from .utils import server_from_buffer
 
 
 @utf8_decode
 def matrix_bar_item_plugin(data, item, window, buffer, extra_info):
     # pylint: disable=unused-argument
-    for server in SERVERS.values():
-        if buffer in server.buffers.values() or buffer == server.server_buffer:
-            return "matrix{color}/{color_fg}{name}".format(
-                color=W.color("bar_delim"),
-                color_fg=W.color("bar_fg"),
-                name=server.name,
-            )
+    server = server_from_buffer(buffer)
+
+    if server:
+        return "matrix{color}/{color_fg}{name}".format(
+            color=W.color("bar_delim"),
+            color_fg=W.color("bar_fg"),
+            name=server.name,
+        )
 
     ptr_plugin = W.buffer_get_pointer(buffer, "plugin")
     name = W.plugin_get_name(ptr_plugin)
@@ -41,34 +43,29 @@ def matrix_bar_item_plugin(data, item, window, buffer, extra_info):
 @utf8_decode
 def matrix_bar_item_name(data, item, window, buffer, extra_info):
     # pylint: disable=unused-argument
-    for server in SERVERS.values():
-        if buffer in server.buffers.values():
-            color = (
-                "status_name_ssl"
-                if server.ssl_context.check_hostname
-                else "status_name"
-            )
+    server = server_from_buffer(buffer)
 
-            room_buffer = server.find_room_from_ptr(buffer)
-            room = room_buffer.room
-
-            return "{color}{name}".format(
-                color=W.color(color), name=room.display_name
-            )
+    if server:
+        color = (
+            "status_name_ssl"
+            if server.ssl_context.check_hostname
+            else "status_name"
+        )
 
         if buffer == server.server_buffer:
-            color = (
-                "status_name_ssl"
-                if server.ssl_context.check_hostname
-                else "status_name"
-            )
-
             return "{color}server{del_color}[{color}{name}{del_color}]".format(
                 color=W.color(color),
                 del_color=W.color("bar_delim"),
                 name=server.name,
             )
 
+        room_buffer = server.find_room_from_ptr(buffer)
+        room = room_buffer.room
+
+        return "{color}{name}".format(
+            color=W.color(color), name=room.display_name
+        )
+
     name = W.buffer_get_string(buffer, "name")
 
     return "{}{}".format(W.color("status_name"), name)
@@ -77,21 +74,20 @@ def matrix_bar_item_name(data, item, window, buffer, extra_info):
 @utf8_decode
 def matrix_bar_item_lag(data, item, window, buffer, extra_info):
     # pylint: disable=unused-argument
-    for server in SERVERS.values():
-        if buffer in server.buffers.values() or buffer == server.server_buffer:
-            if server.lag >= G.CONFIG.network.lag_min_show:
-                color = W.color("irc.color.item_lag_counting")
-                if server.lag_done:
-                    color = W.color("irc.color.item_lag_finished")
-
-                lag = "{0:.3f}" if round(server.lag) < 1000 else "{0:.0f}"
-                lag_string = "Lag: {color}{lag}{ncolor}".format(
-                    lag=lag.format((server.lag / 1000)),
-                    color=color,
-                    ncolor=W.color("reset"),
-                )
-                return lag_string
-            return ""
+    server = server_from_buffer(buffer)
+
+    if server and server.lag >= G.CONFIG.network.lag_min_show:
+        color = W.color("irc.color.item_lag_counting")
+        if server.lag_done:
+            color = W.color("irc.color.item_lag_finished")
+
+        lag = "{0:.3f}" if round(server.lag) < 1000 else "{0:.0f}"
+        lag_string = "Lag: {color}{lag}{ncolor}".format(
+            lag=lag.format((server.lag / 1000)),
+            color=color,
+            ncolor=W.color("reset"),
+        )
+        return lag_string
 
     return ""
 
@@ -99,26 +95,27 @@ def matrix_bar_item_lag(data, item, window, buffer, extra_info):
 @utf8_decode
 def matrix_bar_item_buffer_modes(data, item, window, buffer, extra_info):
     # pylint: disable=unused-argument
-    for server in SERVERS.values():
-        if buffer in server.buffers.values():
-            room_buffer = server.find_room_from_ptr(buffer)
-            room = room_buffer.room
-            modes = []
+    server = server_from_buffer(buffer)
 
-            if room.encrypted:
-                modes.append(G.CONFIG.look.encrypted_room_sign)
+    if server and buffer != server.server_buffer:
+        room_buffer = server.find_room_from_ptr(buffer)
+        room = room_buffer.room
+        modes = []
 
-            if (server.client
-                    and server.client.room_contains_unverified(room.room_id)):
-                modes.append(G.CONFIG.look.encryption_warning_sign)
+        if room.encrypted:
+            modes.append(G.CONFIG.look.encrypted_room_sign)
 
-            if not server.connected or not server.client.logged_in:
-                modes.append(G.CONFIG.look.disconnect_sign)
+        if (server.client
+                and server.client.room_contains_unverified(room.room_id)):
+            modes.append(G.CONFIG.look.encryption_warning_sign)
 
-            if room_buffer.backlog_pending or server.busy:
-                modes.append(G.CONFIG.look.busy_sign)
+        if not server.connected or not server.client.logged_in:
+            modes.append(G.CONFIG.look.disconnect_sign)
 
-            return "".join(modes)
+        if room_buffer.backlog_pending or server.busy:
+            modes.append(G.CONFIG.look.busy_sign)
+
+        return "".join(modes)
 
     return ""
 
@@ -128,11 +125,12 @@ def matrix_bar_nicklist_count(data, item, window, buffer, extra_info):
     # pylint: disable=unused-argument
     color = W.color("status_nicklist_count")
 
-    for server in SERVERS.values():
-        if buffer in server.buffers.values():
-            room_buffer = server.find_room_from_ptr(buffer)
-            room = room_buffer.room
-            return "{}{}".format(color, room.member_count)
+    server = server_from_buffer(buffer)
+
+    if server and buffer != server.server_buffer:
+        room_buffer = server.find_room_from_ptr(buffer)
+        room = room_buffer.room
+        return "{}{}".format(color, room.member_count)
 
     nicklist_enabled = bool(W.buffer_get_integer(buffer, "nicklist"))
 
@@ -150,36 +148,37 @@ def matrix_bar_typing_notices_cb(data, item, window, buffer, extra_info):
        W.bar_item_update(<item>) is explicitly called. The bar item shows
        currently typing users for the current buffer."""
     # pylint: disable=unused-argument
-    for server in SERVERS.values():
-        if buffer in server.buffers.values():
-            room_buffer = server.find_room_from_ptr(buffer)
-            room = room_buffer.room
+    server = server_from_buffer(buffer)
 
-            if room.typing_users:
-                nicks = []
+    if server and buffer != server.server_buffer:
+        room_buffer = server.find_room_from_ptr(buffer)
+        room = room_buffer.room
 
-                for user_id in room.typing_users:
-                    if user_id == room.own_user_id:
-                        continue
+        if room.typing_users:
+            nicks = []
 
-                    nick = room_buffer.displayed_nicks.get(user_id, user_id)
-                    nicks.append(nick)
+            for user_id in room.typing_users:
+                if user_id == room.own_user_id:
+                    continue
 
-                if not nicks:
-                    return ""
+                nick = room_buffer.displayed_nicks.get(user_id, user_id)
+                nicks.append(nick)
 
-                msg = "{}{}".format(
-                    G.CONFIG.look.bar_item_typing_notice_prefix,
-                    ", ".join(sorted(nicks))
-                )
+            if not nicks:
+                return ""
+
+            msg = "{}{}".format(
+                G.CONFIG.look.bar_item_typing_notice_prefix,
+                ", ".join(sorted(nicks))
+            )
 
-                max_len = G.CONFIG.look.max_typing_notice_item_length
-                if len(msg) > max_len:
-                    msg[:max_len - 3] + "..."
+            max_len = G.CONFIG.look.max_typing_notice_item_length
+            if len(msg) > max_len:
+                msg[:max_len - 3] + "..."
 
-                return msg
+            return msg
 
-            return ""
+        return ""
 
     return ""
 
@@ -134,6 +134,8 @@ def room_buffer_input_cb(server_name, buffer, input_data):
 def room_buffer_close_cb(server_name, buffer):
     server = SERVERS[server_name]
     room_buffer = server.find_room_from_ptr(buffer)
+    server.buffer_room_ids.pop(buffer, None)
+    G.BUFFERS.pop(buffer, None)
 
     if room_buffer:
         room_id = room_buffer.room.room_id
@@ -20,7 +20,6 @@ import argparse
 import os
 import re
 from builtins import str
-from future.moves.itertools import zip_longest
 from collections import defaultdict
 from functools import partial
 from nio import EncryptionError, LocalProtocolError
@@ -216,16 +215,9 @@ class WeechatCommandParser(object):
         return WeechatCommandParser._run_parser(parser, args)
 
 
-def grouper(iterable, n, fillvalue=None):
-    "Collect data into fixed-length chunks or blocks"
-    # grouper('ABCDEFG', 3, 'x') --> ABC DEF Gxx"
-    args = [iter(iterable)] * n
-    return zip_longest(*args, fillvalue=fillvalue)
-
-
 def partition_key(key):
-    groups = grouper(key, 4, " ")
-    return ' '.join(''.join(g) for g in groups)
+    # partition_key('ABCDEFGHIJ') --> 'ABCD EFGH IJ'
+    return ' '.join(key[i:i + 4] for i in range(0, len(key), 4))
 
 
 def hook_commands():
@@ -607,8 +599,10 @@ def olm_info_command(server, args):
             W.prnt(server.server_buffer, message)
             return
 
-        server.info("{} devices:\n".format(device_category))
-        W.prnt(server.server_buffer, "\n".join(user_strings))
+        server.info("{} devices:\n\n{}".format(
+            device_category,
+            "\n".join(user_strings)
+        ))
 
     olm = server.client.olm
 
@@ -1631,9 +1625,11 @@ def matrix_server_command_delete(args):
 
             for buf in list(server.buffers.values()):
                 W.buffer_close(buf)
+                G.BUFFERS.pop(buf, None)
 
             if server.server_buffer:
                 W.buffer_close(server.server_buffer)
+                G.BUFFERS.pop(server.server_buffer, None)
 
             for option in server.config._option_ptrs.values():
                 W.config_option_free(option)
@@ -39,6 +39,7 @@ except ImportError:
     W = weechat
 
 SERVERS = dict()  # type: Dict[str, MatrixServer]
+BUFFERS = dict()  # type: Dict[str, str]  # buffer pointer -> server name
 CONFIG = None  # type: Any
 ENCRYPTION = True  # type: bool
 SCRIPT_NAME = "matrix"  # type: str
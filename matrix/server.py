@@ -282,6 +282,7 @@ class MatrixServer(object):
 
         self.room_buffers = dict()  # type: Dict[str, RoomBuffer]
         self.buffers = dict()                # type: Dict[str, str]
+        self.buffer_room_ids = dict()        # type: Dict[str, str]
         self.server_buffer = None            # type: Optional[str]
         self.fd_hook = None                  # type: Optional[str]
         self.ssl_hook = None                 # type: Optional[str]
@@ -1765,16 +1766,17 @@ class MatrixServer(object):
 
         self.room_buffers[room_id] = buf
         self.buffers[room_id] = buf.weechat_buffer._ptr
+        self.buffer_room_ids[buf.weechat_buffer._ptr] = room_id
+        G.BUFFERS[buf.weechat_buffer._ptr] = self.name
 
     def find_room_from_ptr(self, pointer):
-        try:
-            room_id = key_from_value(self.buffers, pointer)
-            room_buffer = self.room_buffers[room_id]
+        room_id = self.buffer_room_ids.get(pointer)
 
-            return room_buffer
-        except (ValueError, KeyError):
+        if room_id is None:
             return None
 
+        return self.room_buffers.get(room_id)
+
     def find_room_from_id(self, room_id):
         room_buffer = self.room_buffers[room_id]
         return room_buffer
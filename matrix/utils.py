@@ -18,9 +18,9 @@
 from __future__ import unicode_literals, division
 
 import time
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 
-from .globals import W
+from .globals import BUFFERS, SERVERS, W
 
 if False:
     from .server import MatrixServer
@@ -31,6 +31,12 @@ def key_from_value(dictionary, value):
     return list(dictionary.keys())[list(dictionary.values()).index(value)]
 
 
+def server_from_buffer(buffer):
+    # type: (str) -> Optional[MatrixServer]
+    server_name = BUFFERS.get(buffer)
+    return SERVERS.get(server_name) if server_name else None
+
+
 def server_buffer_prnt(server, string):
     # type: (MatrixServer, str) -> None
     assert server.server_buffer
@@ -61,6 +67,7 @@ def create_server_buffer(server):
     server.server_buffer = W.buffer_new(
         buffer_name, "server_buffer_cb", server.name, "", ""
     )
+    BUFFERS[server.server_buffer] = server.name
 
     server_buffer_set_title(server)
     W.buffer_set(server.server_buffer, "short_name", server.name)
@@ -3,7 +3,8 @@
 from __future__ import unicode_literals
 
 from matrix.buffer import WeechatChannelBuffer
-from matrix.utils import parse_redact_args
+from matrix.globals import BUFFERS, SERVERS
+from matrix.utils import parse_redact_args, server_from_buffer
 
 
 class TestClass(object):
@@ -66,3 +67,15 @@ class TestClass(object):
         event_id, reason = parse_redact_args(args)
         assert event_id == '$15677776791893pZSXx:example.org'
         assert reason == '"Hello world"'
+
+    def test_server_from_buffer(self):
+        server = object()
+        SERVERS["example.org"] = server
+        BUFFERS["0x1"] = "example.org"
+
+        try:
+            assert server_from_buffer("0x1") is server
+            assert server_from_buffer("0x2") is None
+        finally:
+            BUFFERS.pop("0x1")
+            SERVERS.pop("example.org")
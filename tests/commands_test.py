@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import unicode_literals
+
+from matrix.commands import format_device, partition_key
+from matrix.globals import W
+
+
+class TestClass(object):
+    def test_partition_key(self):
+        assert partition_key("") == ""
+        assert partition_key("ABCD") == "ABCD"
+        assert partition_key("ABCDEFGHIJ") == "ABCD EFGH IJ"
+
+        key = "nE6W2fCblxDcOFmeEtCHNl8/l8bXcu7GKyAswA4r3mM"
+        assert partition_key(key) == (
+            "nE6W 2fCb lxDc OFme EtCH Nl8/ l8bX cu7G KyAs wA4r 3mM"
+        )
+
+    def test_format_device(self):
+        key = "nE6W2fCblxDcOFmeEtCHNl8/l8bXcu7GKyAswA4r3mM"
+        message = format_device("ABCDEFGHIJ", key, "Alice's phone")
+
+        assert message == (
+            "    - Device ID:      {device_color}ABCDEFGHIJ{ncolor}\n"
+            "      - Display name: {device_color}Alice's phone{ncolor}\n"
+            "      - Device key:   {key_color}nE6W 2fCb lxDc OFme EtCH Nl8/ "
+            "l8bX cu7G KyAs wA4r 3mM{ncolor}"
+        ).format(
+            device_color=W.color("chat_channel"),
+            ncolor=W.color("reset"),
+            key_color=W.color("chat_server"),
+        )
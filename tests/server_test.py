@@ -1,5 +1,12 @@
+import ssl
+
+from nio import MatrixRoom
+
+from matrix.buffer import room_buffer_close_cb
+from matrix.commands import matrix_server_command_delete
 from matrix.server import MatrixServer
-from matrix._weechat import MockConfig
+from matrix.utils import create_server_buffer, server_from_buffer
+from matrix._weechat import MockConfig, MockObject
 import matrix.globals as G
 
 G.CONFIG = MockConfig()
@@ -19,3 +26,58 @@ class TestClass(object):
         )
         assert homeserver.hostname == "example.org"
         assert homeserver.geturl() == "https://example.org:80/_matrix"
+
+    def test_buffer_registry(self, monkeypatch):
+        # NPN is unavailable on newer Python/OpenSSL builds, where
+        # set_npn_protocols() raises AttributeError instead of
+        # NotImplementedError.
+        monkeypatch.setattr(
+            ssl.SSLContext,
+            "set_npn_protocols",
+            lambda self, protocols: None
+        )
+
+        server = MatrixServer("example", None)
+        server.homeserver = MatrixServer._parse_url("example.org", 443)
+        server.client = MockObject()
+        server.client.rooms = {
+            "!test:example.org": MatrixRoom(
+                "!test:example.org",
+                "@alice:example.org"
+            )
+        }
+        G.SERVERS[server.name] = server
+        pointers = []
+
+        try:
+            create_server_buffer(server)
+            pointers.append(server.server_buffer)
+            assert G.BUFFERS[server.server_buffer] == server.name
+            assert server_from_buffer(server.server_buffer) is server
+            assert not server.find_room_from_ptr(server.server_buffer)
+
+            server.create_room_buffer("!test:example.org", None)
+            pointer = server.buffers["!test:example.org"]
+            pointers.append(pointer)
+            assert G.BUFFERS[pointer] == server.name
+            assert server_from_buffer(pointer) is server
+            room_buffer = server.find_room_from_ptr(pointer)
+            assert room_buffer.room.room_id == "!test:example.org"
+
+            room_buffer_close_cb(server.name, pointer)
+            assert pointer not in G.BUFFERS
+            assert not server_from_buffer(pointer)
+            assert not server.find_room_from_ptr(pointer)
+
+            server.create_room_buffer("!test:example.org", None)
+            pointer = server.buffers["!test:example.org"]
+            pointers.append(pointer)
+
+            matrix_server_command_delete([server.name])
+            assert server.name not in G.SERVERS
+            for pointer in pointers:
+                assert pointer not in G.BUFFERS
+        finally:
+            G.SERVERS.pop(server.name, None)
+            for pointer in pointers:
+                G.BUFFERS.pop(pointer, None)